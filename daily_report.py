@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# --- Daily Jira Status Report ---
+# Generates the daily digest and delivers it by email and/or Slack,
+# depending on what is configured in config.json.
+#
+# The script runs once and exits, which makes it the natural entrypoint
+# for an OS-level scheduler: the interpreter (and its ~30 MB RSS) is
+# only resident while a report is actually being generated. scheduler.py
+# remains for development. With systemd, a timer pair like this replaces
+# the long-lived polling process:
+#
+#   # /etc/systemd/system/jira-report.service
+#   [Unit]
+#   Description=Daily Jira status report
+#   [Service]
+#   Type=oneshot
+#   WorkingDirectory=/opt/jira-report
+#   ExecStart=/usr/bin/python3 daily_report.py
+#
+#   # /etc/systemd/system/jira-report.timer
+#   [Unit]
+#   Description=Run the daily Jira status report at 09:00
+#   [Timer]
+#   OnCalendar=*-*-* 09:00:00
+#   Persistent=true
+#   [Install]
+#   WantedBy=timers.target
+#
+# Equivalent cron entry:
+#   0 9 * * *  cd /opt/jira-report && python3 daily_report.py
+import argparse
+import functools
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Only the lightweight config module is imported eagerly. The Jira,
+# report, email, and Slack modules (which pull in jira/requests) are
+# imported inside the subsystem properties below, so a process that
+# never touches a subsystem — e.g. the scheduler between runs, or a
+# run that fails config validation — never pays those imports.
+from src.config_manager import ConfigManager
+
+# Configure basic logging
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+class DailyReporter:
+    """
+    Wires together config, Jira access, report generation, and delivery.
+    """
+
+    def __init__(self, config_file='config.json', config_manager=None):
+        # An already-loaded ConfigManager can be injected (e.g. by the
+        # scheduler) so each trigger reuses the parsed config instead of
+        # re-reading the file.
+        if config_manager is not None:
+            self.config_manager = config_manager
+        else:
+            self.config_manager = ConfigManager(config_file)
+        # Rendered (text, html) bodies keyed by digest identity, so a
+        # retry or a second channel doesn't re-render the same digest.
+        self._formatted_cache = {}
+
+    # Subsystems are built (and connected) lazily on first access, so a
+    # run that never touches a channel never pays its setup cost — e.g.
+    # a Slack-only deployment skips SMTP login entirely.
+
+    @functools.cached_property
+    def jira_client(self):
+        from src.jira_client import JiraClient
+
+        jira_cfg = self.config_manager.get_jira_config()
+        client = JiraClient(jira_cfg['server'], jira_cfg['email'],
+                            jira_cfg['api_token'])
+        if not client.connect():
+            raise RuntimeError(f"Could not connect to Jira at {jira_cfg['server']}")
+        return client
+
+    @functools.cached_property
+    def report_generator(self):
+        from src.report_generator import ReportGenerator
+
+        return ReportGenerator(self.jira_client)
+
+    @functools.cached_property
+    def email_sender(self):
+        if not self.config_manager.has_email_config():
+            return None
+        from src.email_sender import create_email_sender
+
+        email_cfg = self.config_manager.get_email_config()
+        return create_email_sender(
+            email_cfg['smtp_server'], email_cfg['smtp_port'],
+            email_cfg['email_address'], email_cfg['email_password'])
+
+    @functools.cached_property
+    def slack_notifier(self):
+        if not self.config_manager.has_slack_config():
+            return None
+        from src.slack_notifier import SlackNotifier
+
+        slack_cfg = self.config_manager.get_slack_config()
+        return SlackNotifier(slack_cfg['webhook_url'])
+
+    def setup(self):
+        """
+        Loads the configuration; subsystems are built lazily on first use.
+
+        Returns:
+            bool: True if setup succeeded, False otherwise.
+        """
+        try:
+            self.config_manager.load_config()
+            return True
+        except (FileNotFoundError, ValueError) as e:
+            logger.error("Configuration error: %s", e)
+            return False
+
+    def generate_report(self, project_keys=None):
+        """Generates the daily digest for the given projects."""
+        return self.report_generator.generate_daily_digest(project_keys)
+
+    def _render_once(self, digest):
+        """Returns the (text, html) renderings of a digest, caching them."""
+        key = id(digest)
+        if key not in self._formatted_cache:
+            self._formatted_cache[key] = (
+                self.report_generator.format_digest_as_text(digest),
+                self.report_generator.format_digest_as_html(digest),
+            )
+        return self._formatted_cache[key]
+
+    def send_email_report(self, digest):
+        """Renders the digest and emails it to the configured recipients."""
+        recipients = self.config_manager.get_email_config()['recipients']
+        subject = f"Daily Jira Status Report - {digest['date']}"
+        report_text, report_html = self._render_once(digest)
+        # Genuinely large recipient lists go out as concurrent batches
+        # over one async SMTP session (with a sync fallback inside
+        # send_report_bulk); everything else takes the single sync send.
+        if len(recipients) > 20:
+            groups = [recipients[i:i + 10]
+                      for i in range(0, len(recipients), 10)]
+            return self.email_sender.send_report_bulk(groups, subject,
+                                                      report_text, report_html)
+        # Don't close the sender here: it's the factory's shared,
+        # persistent connection, meant to survive across scheduler
+        # triggers (and possibly other reporters with the same
+        # settings). _get_server's NOOP check revives it if the server
+        # dropped us in the meantime.
+        return self.email_sender.send_report(recipients, subject,
+                                             report_text, report_html)
+
+    def send_slack_report(self, digest):
+        """Sends the digest to the configured Slack webhook."""
+        return self.slack_notifier.send_report(digest)
+
+    def run(self, project_keys=None):
+        """
+        Runs the full daily report: generate, then deliver on every
+        configured channel.
+
+        Returns:
+            bool: True if at least one channel delivered successfully.
+        """
+        # One multi-line record per banner: a single lock acquisition,
+        # format, and flush instead of one per line.
+        logger.info("\n".join([
+            "=" * 80,
+            "Starting daily Jira status report",
+            "=" * 80,
+        ]))
+
+        # Bound memory: renderings only need to live for one run.
+        self._formatted_cache.clear()
+
+        if not self.setup():
+            return False
+
+        # Check delivery channels before touching Jira at all: with
+        # nothing to send, generating the digest (and the JQL searches
+        # behind it) would be pure wasted work.
+        if not self.email_sender and not self.slack_notifier:
+            logger.error("No delivery channel configured (email or Slack)")
+            return False
+
+        try:
+            digest = self.generate_report(project_keys)
+        except RuntimeError as e:
+            logger.error("%s", e)
+            return False
+        logger.info("Report generated with %d projects", len(digest.get('projects', [])))
+
+        # Build the shared render view once, before the delivery threads
+        # start: the text, HTML, and Slack formatters all read it off the
+        # digest instead of re-truncating the same strings per channel.
+        self.report_generator.build_digest_view(digest)
+
+        # Email and Slack hit independent endpoints, so deliver them
+        # concurrently: total latency is max(email, slack), not the sum.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            email_future = (executor.submit(self.send_email_report, digest)
+                            if self.email_sender else None)
+            slack_future = (executor.submit(self.send_slack_report, digest)
+                            if self.slack_notifier else None)
+            email_success = email_future.result() if email_future else False
+            slack_success = slack_future.result() if slack_future else False
+
+        logger.info("\n".join([
+            "=" * 80,
+            "Daily Report Summary:",
+            f"  Email: {'sent' if email_success else 'not sent'}",
+            f"  Slack: {'sent' if slack_success else 'not sent'}",
+            "=" * 80,
+        ]))
+        return email_success or slack_success
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Generate and deliver the daily Jira status report '
+                    'once, then exit.')
+    parser.add_argument('--project-keys', nargs='*', default=None,
+                        metavar='KEY',
+                        help='Project keys to include in the digest '
+                             '(default: the first projects on the instance)')
+    args = parser.parse_args()
+
+    reporter = DailyReporter()
+    success = reporter.run(args.project_keys)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,8 +10,26 @@ import logging
 # Configure basic logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+
+def _starttls_connect(smtp_server, smtp_port):
+    """Opens a STARTTLS-secured connection (typically port 587 or 25)."""
+    server = smtplib.SMTP(smtp_server, smtp_port)
+    server.ehlo()  # Extended Hello to server
+    server.starttls()  # Secure the connection
+    server.ehlo()  # Re-identify ourselves as an ESMTP client
+    return server
+
+# Connection strategy per port, chosen once at import time instead of
+# re-branching on every send. Port 465 expects SSL from the start.
+# Example for Gmail: smtp_server='smtp.gmail.com', smtp_port=587
+# Example for Outlook/Office365: smtp_server='smtp.office365.com', smtp_port=587
+# For other providers, check their SMTP settings.
+_CONNECT = {465: smtplib.SMTP_SSL}
+
+
 def send_status_email(subject, body_text, sender_email, receiver_email,
-                        smtp_server, smtp_port, smtp_username, smtp_password):
+                        smtp_server, smtp_port, smtp_username, smtp_password,
+                        retries=2):
     """
     Sends an email with the given subject and body.
 
@@ -25,10 +43,16 @@ def send_status_email(subject, body_text, sender_email, receiver_email,
         smtp_port (int): The SMTP server port.
         smtp_username (str): The username for SMTP authentication.
         smtp_password (str): The password for SMTP authentication.
+        retries (int): Number of send attempts before giving up.
+                       Values below 1 are treated as 1 (a single attempt).
 
     Returns:
         bool: True if the email was sent successfully, False otherwise.
     """
+    # With retries < 1 the attempt loop would never run and the function
+    # would report success without sending anything; always try at least once.
+    retries = max(1, retries)
+    server = None # Initialize server to None for the finally block
     try:
         msg = MIMEText(body_text, 'plain', 'utf-8')
         msg['Subject'] = Header(subject, 'utf-8')
@@ -41,41 +65,43 @@ def send_status_email(subject, body_text, sender_email, receiver_email,
             recipients_list = [receiver_email]
             msg['To'] = receiver_email
 
-        # Connect to the SMTP server
-        # Example for Gmail: smtp_server='smtp.gmail.com', smtp_port=587
-        # Example for Outlook/Office365: smtp_server='smtp.office365.com', smtp_port=587
-        # For other providers, check their SMTP settings.
-        # Use smtplib.SMTP_SSL() for servers requiring SSL from the start (e.g., port 465)
-        
-        server = None # Initialize server to None for the finally block
-        if smtp_port == 465: # SSL connection
-            server = smtplib.SMTP_SSL(smtp_server, smtp_port)
-        else: # TLS connection (typically port 587 or 25)
-            server = smtplib.SMTP(smtp_server, smtp_port)
-            server.ehlo()  # Extended Hello to server
-            server.starttls()  # Secure the connection
-            server.ehlo()  # Re-identify ourselves as an ESMTP client
+        # Serialize the MIME message once, up front; the retry loop below
+        # reuses these bytes instead of re-encoding the body per attempt.
+        msg_bytes = msg.as_bytes()
 
+        connect = _CONNECT.get(smtp_port, _starttls_connect)
+        server = connect(smtp_server, smtp_port)
         server.login(smtp_username, smtp_password)
-        server.sendmail(sender_email, recipients_list, msg.as_string())
-        
-        logging.info(f"Email sent successfully to {', '.join(recipients_list)}.")
+
+        for attempt in range(1, retries + 1):
+            try:
+                server.sendmail(sender_email, recipients_list, msg_bytes)
+                break
+            except smtplib.SMTPServerDisconnected:
+                if attempt == retries:
+                    raise
+                # Reconnect and retry with the already-serialized message.
+                logging.warning("SMTP server disconnected; reconnecting (attempt %d of %d).", attempt, retries)
+                server = connect(smtp_server, smtp_port)
+                server.login(smtp_username, smtp_password)
+
+        logging.info("Email sent successfully to %s.", ', '.join(recipients_list))
         return True
 
     except smtplib.SMTPAuthenticationError as e:
-        logging.error(f"SMTP Authentication Error: {e}. Check username/password. If using Gmail, consider 'App Passwords'.")
+        logging.error("SMTP Authentication Error: %s. Check username/password. If using Gmail, consider 'App Passwords'.", e)
         return False
     except smtplib.SMTPServerDisconnected as e:
-        logging.error(f"SMTP Server Disconnected: {e}. This might be due to TLS/SSL issues or server problems.")
+        logging.error("SMTP Server Disconnected: %s. This might be due to TLS/SSL issues or server problems.", e)
         return False
     except smtplib.SMTPConnectError as e:
-        logging.error(f"SMTP Connection Error: {e}. Check SMTP server address and port.")
+        logging.error("SMTP Connection Error: %s. Check SMTP server address and port.", e)
         return False
     except smtplib.SMTPException as e: # Catch other SMTP related errors
-        logging.error(f"SMTP Error: {e}")
+        logging.error("SMTP Error: %s", e)
         return False
     except Exception as e:
-        logging.error(f"An unexpected error occurred: {e}")
+        logging.error("An unexpected error occurred: %s", e)
         return False
     finally:
         if server:
@@ -84,7 +110,7 @@ def send_status_email(subject, body_text, sender_email, receiver_email,
             except smtplib.SMTPServerDisconnected:
                 logging.warning("Server was already disconnected.")
             except Exception as e_quit:
-                logging.error(f"Error during server.quit(): {e_quit}")
+                logging.error("Error during server.quit(): %s", e_quit)
 
 
 def generate_status_report():
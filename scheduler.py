@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# --- Daily Report Scheduler ---
+# Runs the daily Jira status report at a fixed time each day.
+import logging
+import sys
+import time
+
+import schedule
+
+from src.config_manager import ConfigManager
+from daily_report import DailyReporter
+
+# Configure basic logging
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def run_daily_report(config_manager):
+    """Runs one daily report cycle; called by the scheduler."""
+    logger.info("Scheduler triggered daily report")
+    # Reuse the scheduler's already-loaded ConfigManager: load_config is
+    # a no-op unless the file changed on disk, so a trigger costs zero
+    # config parses in the normal case.
+    reporter = DailyReporter(config_manager=config_manager)
+    success = reporter.run()
+    if success:
+        logger.info("Scheduled daily report completed successfully")
+    else:
+        logger.error("Scheduled daily report failed")
+
+
+def main():
+    config_manager = ConfigManager()
+    try:
+        config_manager.load_config()
+    except (FileNotFoundError, ValueError) as e:
+        logger.error("Configuration error: %s", e)
+        sys.exit(1)
+
+    schedule_time = config_manager.get('schedule_time', '09:00')
+    schedule.every().day.at(schedule_time).do(run_daily_report, config_manager)
+    logger.info("Scheduler started; daily report will run at %s", schedule_time)
+
+    # Sleep until the next scheduled run instead of polling every minute:
+    # the process stays fully idle between runs. The sleep is capped at
+    # one hour so clock changes (e.g. DST) can't strand the process.
+    try:
+        while True:
+            idle = schedule.idle_seconds()
+            if idle is None:
+                break
+            if idle > 0:
+                time.sleep(min(idle, 3600))
+            schedule.run_pending()
+    except KeyboardInterrupt:
+        logger.info("Scheduler stopped by user")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+# Jira daily report package.
+#
+# Submodules are imported lazily (PEP 562) so that importing the package
+# costs only a dict lookup; entrypoints that never touch a subsystem
+# (e.g. the scheduler before its first run) never pay for its imports.
+import importlib
+
+# Public name -> submodule that defines it.
+_LAZY_ATTRS = {
+    'AsyncJiraClient': '.async_jira_client',
+    'ConfigManager': '.config_manager',
+    'EmailSender': '.email_sender',
+    'JiraClient': '.jira_client',
+    'ReportGenerator': '.report_generator',
+    'SlackNotifier': '.slack_notifier',
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # cache so __getattr__ runs once per name
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
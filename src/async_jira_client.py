@@ -0,0 +1,84 @@
+# --- Async Jira REST API Access ---
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncJiraClient:
+    """
+    Asyncio-based Jira search client for the digest fan-out.
+
+    The digest workload is pure I/O across many independent JQLs, so a
+    single event loop over one HTTP/2 connection multiplexes all of
+    them without the per-thread stack cost of a wide thread pool. The
+    client talks to the REST API directly and returns raw issue dicts;
+    JiraClient remains the synchronous path.
+    """
+
+    DEFAULT_FIELDS = ('summary', 'status', 'assignee', 'created',
+                      'duedate', 'priority')
+
+    def __init__(self, server, email, api_token, max_connections=32):
+        self.server = server.rstrip('/')
+        self.max_connections = max_connections
+        self._auth = (email, api_token)
+        self._client = None
+
+    async def connect(self):
+        """Opens the pooled HTTP/2 client session."""
+        limits = httpx.Limits(max_connections=self.max_connections,
+                              max_keepalive_connections=self.max_connections)
+        self._client = httpx.AsyncClient(
+            base_url=self.server, auth=self._auth,
+            http2=True, limits=limits, timeout=30.0)
+
+    async def close(self):
+        """Closes the client session."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def get_projects(self):
+        """Returns the raw project dicts visible to the user."""
+        response = await self._client.get('/rest/api/2/project')
+        response.raise_for_status()
+        return response.json()
+
+    async def search_issues(self, jql, fields=None, page_size=100):
+        """
+        Runs a JQL search and returns the raw issue dicts, following
+        the enhanced-search endpoint's nextPageToken pagination.
+
+        Args:
+            jql (str): The JQL query string.
+            fields (str|list): Field list (DEFAULT_FIELDS if None).
+            page_size (int): Issues fetched per request.
+
+        Returns:
+            list: Raw issue dicts as returned by the REST API.
+        """
+        if fields is None:
+            fields = list(self.DEFAULT_FIELDS)
+        elif isinstance(fields, str):
+            fields = fields.split(',')
+        payload = {'jql': jql, 'maxResults': page_size, 'fields': fields}
+        issues = []
+        while True:
+            response = await self._client.post('/rest/api/3/search/jql',
+                                               json=payload)
+            response.raise_for_status()
+            data = response.json()
+            issues.extend(data.get('issues', []))
+            token = data.get('nextPageToken')
+            if not token:
+                return issues
+            payload['nextPageToken'] = token
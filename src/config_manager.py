@@ -0,0 +1,169 @@
+# --- Configuration File Handling ---
+import json
+import logging
+import os
+from pathlib import Path
+
+# orjson parses 2-5x faster than stdlib json; ujson is the next-best
+# accelerated parser where orjson has no wheel. Fall back silently to
+# stdlib since config files are small anyway.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+        _loads = ujson.loads
+    except ImportError:
+        _loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+CONFIG_FILENAME = "config.json"
+REQUIRED_JIRA_KEYS = ["jira_server", "jira_email", "jira_api_token"]
+_REQUIRED = frozenset(REQUIRED_JIRA_KEYS)
+
+
+class ConfigManager:
+    """
+    Loads configuration from a JSON file and caches the parsed result.
+
+    The file is parsed exactly once per instance; the per-subsystem views
+    (Jira, email, Slack) are derived at load time so repeated getter calls
+    are plain attribute reads instead of re-reading the file or rebuilding
+    dictionaries.
+    """
+
+    def __init__(self, config_file=CONFIG_FILENAME):
+        self.config_file = config_file
+        self.config = None
+        self._loaded = False
+        self._jira_cfg = None
+        self._email_cfg = None
+        self._slack_cfg = None
+        self._has_email = False
+        self._has_slack = False
+        self._mtime = None
+
+    def _maybe_reload(self):
+        """Returns True if the cached config is still current on disk."""
+        try:
+            return os.stat(self.config_file).st_mtime_ns == self._mtime
+        except OSError:
+            # File vanished since the last load; keep the cached config.
+            return True
+
+    def load_config(self):
+        """
+        Loads and validates the configuration file.
+
+        Returns:
+            dict: The full configuration dictionary.
+
+        Raises:
+            FileNotFoundError: If the configuration file does not exist.
+            ValueError: If the file cannot be parsed or required keys are missing.
+        """
+        if self._loaded and self._maybe_reload():
+            # File unchanged since the last parse: re-load is a no-op.
+            return self.config
+
+        config_path = Path(self.config_file)
+        if not config_path.exists():
+            raise FileNotFoundError(
+                f"Configuration file not found at '{self.config_file}'. "
+                "Please create it with your Jira server, email, and API token."
+            )
+
+        mtime = os.stat(self.config_file).st_mtime_ns
+        try:
+            config_data = _loads(config_path.read_bytes())
+        except ValueError as e:
+            raise ValueError(
+                f"Could not parse JSON in configuration file '{self.config_file}': {e}"
+            )
+
+        # Basic validation (check if essential keys exist) in one pass.
+        missing = _REQUIRED - config_data.keys()
+        if missing:
+            raise ValueError(
+                f"Configuration file '{self.config_file}' is missing required keys: {sorted(missing)}"
+            )
+
+        # Normalize recipient addresses once at load time: strip
+        # whitespace, drop entries without an '@', and de-duplicate
+        # case-insensitively while keeping order and original casing.
+        # Per-run consumers then get a clean list with no re-validation.
+        if 'email_recipients' in config_data:
+            seen = {}
+            for address in config_data['email_recipients']:
+                if address and '@' in address:
+                    seen.setdefault(address.strip().lower(), address.strip())
+            config_data['email_recipients'] = list(seen.values())
+
+        self.config = config_data
+
+        # Precompute the per-subsystem views once so the getters below are
+        # simple attribute reads on every subsequent call.
+        self._jira_cfg = {
+            'server': config_data['jira_server'],
+            'email': config_data['jira_email'],
+            'api_token': config_data['jira_api_token'],
+        }
+        self._email_cfg = {
+            'smtp_server': config_data.get('smtp_server'),
+            'smtp_port': config_data.get('smtp_port', 587),
+            'email_address': config_data.get('email_address'),
+            'email_password': config_data.get('email_password'),
+            'recipients': config_data.get('email_recipients', []),
+        }
+        self._slack_cfg = {
+            'webhook_url': config_data.get('slack_webhook_url'),
+        }
+        self._has_email = bool(
+            self._email_cfg['smtp_server']
+            and self._email_cfg['email_address']
+            and self._email_cfg['email_password']
+            and self._email_cfg['recipients']
+        )
+        self._has_slack = bool(self._slack_cfg['webhook_url'])
+
+        self._mtime = mtime
+        self._loaded = True
+        logger.info("Successfully loaded configuration from '%s'", self.config_file)
+        return self.config
+
+    def _ensure_loaded(self):
+        # Load exactly once; every getter funnels through this guard.
+        if not self._loaded:
+            self.load_config()
+
+    def get(self, key, default=None):
+        """Returns a top-level configuration value."""
+        self._ensure_loaded()
+        return self.config.get(key, default)
+
+    def get_jira_config(self):
+        """Returns the Jira connection settings (server, email, api_token)."""
+        self._ensure_loaded()
+        return self._jira_cfg
+
+    def get_email_config(self):
+        """Returns the SMTP/email settings."""
+        self._ensure_loaded()
+        return self._email_cfg
+
+    def get_slack_config(self):
+        """Returns the Slack webhook settings."""
+        self._ensure_loaded()
+        return self._slack_cfg
+
+    def has_email_config(self):
+        """Returns True if enough settings are present to send email."""
+        self._ensure_loaded()
+        return self._has_email
+
+    def has_slack_config(self):
+        """Returns True if a Slack webhook URL is configured."""
+        self._ensure_loaded()
+        return self._has_slack
@@ -0,0 +1,258 @@
+# --- Email Delivery ---
+import hashlib
+import logging
+import smtplib
+import ssl
+from email.header import Header
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+logger = logging.getLogger(__name__)
+
+
+class EmailSender:
+    """
+    Sends report emails over a persistent SMTP connection.
+
+    The connection is opened (and authenticated) on first use and kept
+    alive across sends; a NOOP liveness check transparently reconnects
+    if the server dropped us. This saves one TLS handshake plus AUTH
+    round-trip per additional message.
+    """
+
+    def __init__(self, smtp_server, smtp_port, email_address, email_password):
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self.email_address = email_address
+        self.email_password = email_password
+        self._server = None
+        # Build the TLS context once per sender: reloading the CA bundle
+        # on every reconnect is pure repeated work.
+        self._ssl_ctx = ssl.create_default_context()
+
+    def _connect(self):
+        """Opens and authenticates a fresh SMTP connection."""
+        # Use SMTP_SSL for servers requiring SSL from the start (port 465),
+        # otherwise STARTTLS (typically port 587 or 25).
+        if self.smtp_port == 465:
+            server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port,
+                                      context=self._ssl_ctx)
+        else:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+            server.ehlo()
+            server.starttls(context=self._ssl_ctx)
+            server.ehlo()
+        server.login(self.email_address, self.email_password)
+        logger.info("Connected to SMTP server %s:%s", self.smtp_server, self.smtp_port)
+        return server
+
+    def _get_server(self):
+        """Returns a live, authenticated SMTP connection, reconnecting if needed."""
+        if self._server is not None:
+            try:
+                status, _ = self._server.noop()
+                if status == 250:
+                    return self._server
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPException, OSError):
+                pass
+            # Stale connection; drop it and fall through to reconnect.
+            self._drop_server()
+        self._server = self._connect()
+        return self._server
+
+    def _drop_server(self):
+        if self._server is not None:
+            try:
+                self._server.close()
+            except Exception:
+                pass
+            self._server = None
+
+    def close(self):
+        """Closes the persistent SMTP connection, if open."""
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except smtplib.SMTPServerDisconnected:
+                logger.warning("SMTP server was already disconnected.")
+            except Exception as e:
+                logger.error("Error while closing SMTP connection: %s", e)
+            self._server = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def _build_message(self, recipients, subject, body_text, body_html=None):
+        """Builds the MIME message for the given recipients."""
+        if body_html:
+            msg = MIMEMultipart('alternative')
+            msg.attach(MIMEText(body_text or '', 'plain', 'utf-8'))
+            msg.attach(MIMEText(body_html, 'html', 'utf-8'))
+        else:
+            # Text-only mail stays a single part: no multipart boundary,
+            # smaller serialized payload.
+            msg = MIMEText(body_text or '', 'plain', 'utf-8')
+        msg['Subject'] = Header(subject, 'utf-8')
+        msg['From'] = self.email_address
+        # For large recipient lists, keep the header compact: every
+        # address still gets its own RCPT TO, but the serialized message
+        # no longer carries the full list in 'To'.
+        if len(recipients) > 10:
+            msg['To'] = self.email_address
+        else:
+            msg['To'] = ', '.join(recipients)
+        return msg
+
+    def send_email(self, recipients, subject, body_text, body_html=None):
+        """
+        Sends one email to the given recipients.
+
+        Args:
+            recipients (str or list): Recipient address(es).
+            subject (str): The subject of the email.
+            body_text (str): The plain text body.
+            body_html (str): Optional HTML body.
+
+        Returns:
+            bool: True if the email was sent successfully, False otherwise.
+        """
+        if isinstance(recipients, str):
+            recipients = [recipients]
+
+        if not body_text and not body_html:
+            logger.warning("Nothing to send: both email bodies are empty.")
+            return False
+
+        # Build and serialize the message before any network work: the
+        # connection is only opened (or revived) once the payload bytes
+        # are ready, so the socket never sits idle while a large HTML
+        # report is being encoded.
+        msg = self._build_message(recipients, subject, body_text, body_html)
+        payload = msg.as_bytes()
+
+        try:
+            server = self._get_server()
+            # All recipients go out as one RCPT batch in a single DATA
+            # transaction, reusing the pre-serialized payload.
+            server.sendmail(self.email_address, recipients, payload)
+            logger.info("Email sent successfully to %s.", ', '.join(recipients))
+            return True
+
+        except smtplib.SMTPAuthenticationError as e:
+            logger.error("SMTP Authentication Error: %s. Check username/password.", e)
+            self._drop_server()
+            return False
+        except smtplib.SMTPException as e:
+            logger.error("SMTP Error: %s", e)
+            self._drop_server()
+            return False
+        except Exception as e:
+            logger.error("An unexpected error occurred sending email: %s", e)
+            self._drop_server()
+            return False
+
+    def send_report(self, recipients, subject, report_text, report_html=None):
+        """Sends a report to the configured recipients over one connection."""
+        return self.send_email(recipients, subject, report_text, report_html)
+
+    async def send_report_async(self, recipient_groups, subject, report_text,
+                                report_html=None):
+        """
+        Sends the report to several recipient groups over one shared
+        authenticated aiosmtplib connection, overlapping the sends.
+
+        Args:
+            recipient_groups (list of list): Recipient address batches;
+                each batch goes out as its own message.
+
+        Returns:
+            bool: True if every batch was accepted.
+        """
+        import asyncio
+
+        import aiosmtplib  # optional; only needed for bulk fan-out
+
+        use_tls = self.smtp_port == 465
+        smtp = aiosmtplib.SMTP(hostname=self.smtp_server, port=self.smtp_port,
+                               use_tls=use_tls, start_tls=not use_tls,
+                               tls_context=self._ssl_ctx)
+        await smtp.connect()
+        try:
+            await smtp.login(self.email_address, self.email_password)
+            results = await asyncio.gather(
+                *(smtp.send_message(
+                    self._build_message(group, subject, report_text, report_html),
+                    recipients=group)
+                  for group in recipient_groups),
+                return_exceptions=True)
+        finally:
+            try:
+                await smtp.quit()
+            except Exception:
+                pass
+
+        success = True
+        for group, result in zip(recipient_groups, results):
+            if isinstance(result, Exception):
+                logger.error("Error sending report to %s: %s", ', '.join(group), result)
+                success = False
+        return success
+
+    def send_report_bulk(self, recipient_groups, subject, report_text,
+                         report_html=None):
+        """
+        Sends the report to several recipient groups, preferring the
+        concurrent aiosmtplib path. When that path is unavailable
+        (aiosmtplib is optional) or its connect/login fails, the groups
+        go out sequentially over the persistent sync connection instead
+        of the failure propagating to the caller.
+
+        Returns:
+            bool: True if every group was delivered.
+        """
+        import asyncio
+
+        try:
+            return asyncio.run(self.send_report_async(
+                recipient_groups, subject, report_text, report_html))
+        except ImportError:
+            logger.info("aiosmtplib not installed; sending batches over "
+                        "the persistent sync connection")
+        except Exception as e:
+            logger.error("Bulk async send failed (%s); falling back to "
+                         "the persistent sync connection", e)
+
+        success = True
+        for group in recipient_groups:
+            success = self.send_report(group, subject, report_text,
+                                       report_html) and success
+        return success
+
+
+# Shared senders keyed by connection settings. The key carries a hash of
+# the password rather than the password itself; the dict (not lru_cache)
+# lets the sender still be constructed with the real credential.
+_SENDERS = {}
+
+
+def create_email_sender(smtp_server, smtp_port, email_address, email_password):
+    """
+    Returns a shared EmailSender for the given settings.
+
+    Repeated setups with the same settings (e.g. one per scheduler
+    trigger) reuse the existing sender — and with it the persistent,
+    already-authenticated SMTP connection — instead of paying DNS, TLS,
+    and AUTH again.
+    """
+    password_hash = hashlib.sha256(email_password.encode('utf-8')).hexdigest()
+    key = (smtp_server, smtp_port, email_address, password_hash)
+    sender = _SENDERS.get(key)
+    if sender is None:
+        sender = EmailSender(smtp_server, smtp_port, email_address,
+                             email_password)
+        _SENDERS[key] = sender
+    return sender
@@ -0,0 +1,451 @@
+# --- Jira REST API Access ---
+import hashlib
+import itertools
+import logging
+import shelve
+import time
+from collections import defaultdict
+
+import requests
+from jira import JIRA
+from requests.adapters import HTTPAdapter, Retry
+
+# diskcache backs the optional persistent response cache (see
+# search_issues_cached); without it the client just refetches.
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+logger = logging.getLogger(__name__)
+
+
+class _TTLCache:
+    """Tiny timestamp-based cache for rarely-changing metadata."""
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._entries = {}
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        timestamp, value = entry
+        if time.monotonic() - timestamp > self.ttl:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key, value):
+        self._entries[key] = (time.monotonic(), value)
+
+    def clear(self):
+        self._entries.clear()
+
+
+class _ProjectRef:
+    """Lightweight picklable stand-in for a disk-cached jira Project."""
+
+    __slots__ = ('id', 'key', 'name')
+
+    def __init__(self, project_id, key, name):
+        self.id = project_id
+        self.key = key
+        self.name = name
+
+
+class JiraClient:
+    """
+    Thin wrapper around the jira-python client used by the daily reports.
+    """
+
+    # The reports only ever read these fields. Defaulting the searches to
+    # this whitelist (instead of '*all') keeps responses small even on
+    # instances with hundreds of custom fields; callers that genuinely
+    # need everything pass fields='*all' explicitly.
+    DEFAULT_FIELDS = ('summary', 'status', 'assignee', 'created',
+                      'duedate', 'priority')
+
+    # Cross-process project cache: repeat short-lived runs (e.g. the
+    # smoke test) reuse yesterday's project list instead of refetching.
+    PROJECTS_DB = '.jira_projects.db'
+    PROJECTS_DISK_TTL = 3600
+
+    def __init__(self, server, email, api_token, metadata_ttl=600,
+                 pool_size=32, cache_dir=None):
+        self.server = server
+        self.email = email
+        self.api_token = api_token
+        self.pool_size = pool_size
+        self.jira = None
+        # Projects, boards, and field definitions change rarely; cache
+        # them for metadata_ttl seconds so repeat reports hit a dict
+        # lookup instead of a network round-trip.
+        self._metadata_cache = _TTLCache(ttl=metadata_ttl)
+        # Optional on-disk cache for search snapshots, enabled by
+        # passing a cache_dir when diskcache is installed.
+        if cache_dir is not None and diskcache is not None:
+            self._disk_cache = diskcache.Cache(cache_dir)
+        else:
+            self._disk_cache = None
+
+    def connect(self):
+        """
+        Authenticates against the Jira server.
+
+        Returns:
+            bool: True if the connection succeeded, False otherwise.
+        """
+        jira_options = {'server': self.server}
+        # Inject a session with a pool sized for the digest's concurrent
+        # searches: keep-alive skips the TCP+TLS handshake per request,
+        # and the wide pool avoids connection recycling under threading.
+        # Retry absorbs Jira's transient 429/5xx responses with backoff.
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504]))
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.auth = (self.email, self.api_token)
+        # Ask explicitly for keep-alive so intermediaries that default
+        # to closing after each response keep the connection open too.
+        session.headers['Connection'] = 'keep-alive'
+        try:
+            self.jira = JIRA(options=jira_options, session=session)
+            logger.info("Successfully connected to Jira at %s", self.server)
+            return True
+        except Exception as e:
+            logger.error("Error connecting to Jira: %s", e)
+            return False
+
+    def get_projects(self, limit=None, use_disk_cache=False):
+        """
+        Returns the projects visible to the authenticated user (cached).
+
+        Args:
+            limit (int): Return only the first `limit` projects. The
+                         full list is fetched and cached once either
+                         way, so any later call — whatever its limit —
+                         is a local slice, not another round-trip.
+            use_disk_cache (bool): Also consult the cross-process shelve
+                         cache (one-hour TTL, keyed by server and
+                         account). Off by default: hits from disk are
+                         lightweight id/key/name refs rather than full
+                         Project resources, can lag the server by up to
+                         an hour, and leave a .jira_projects.db file in
+                         the working directory — acceptable trade-offs
+                         for repeat dev/smoke-test runs, not for the
+                         production report path.
+        """
+        projects = self._metadata_cache.get('projects')
+        if projects is None and use_disk_cache:
+            projects = self._load_cached_projects()
+            if projects is not None:
+                self._metadata_cache.set('projects', projects)
+        if projects is None:
+            projects = self.jira.projects()
+            self._metadata_cache.set('projects', projects)
+            if use_disk_cache:
+                self._save_cached_projects(projects)
+        if limit is not None:
+            return projects[:limit]
+        return projects
+
+    def _load_cached_projects(self):
+        """Returns the disk-cached project refs if still fresh, else None."""
+        try:
+            with shelve.open(self.PROJECTS_DB) as db:
+                entry = db.get(f'{self.server}|{self.email}')
+        except Exception:
+            return None
+        if entry is None:
+            return None
+        timestamp, projects = entry
+        if time.time() - timestamp > self.PROJECTS_DISK_TTL:
+            return None
+        return projects
+
+    def _save_cached_projects(self, projects):
+        """Stores the project list on disk for later runs (best effort)."""
+        refs = [_ProjectRef(project.id, project.key, project.name)
+                for project in projects]
+        try:
+            with shelve.open(self.PROJECTS_DB) as db:
+                db[f'{self.server}|{self.email}'] = (time.time(), refs)
+        except Exception as e:
+            logger.warning("Could not write project cache: %s", e)
+
+    def get_boards(self):
+        """Returns all boards visible to the authenticated user (cached)."""
+        boards = self._metadata_cache.get('boards')
+        if boards is None:
+            boards = self.jira.boards()
+            self._metadata_cache.set('boards', boards)
+        return boards
+
+    def get_custom_fields(self):
+        """Returns the custom field definitions on this instance (cached)."""
+        custom_fields = self._metadata_cache.get('custom_fields')
+        if custom_fields is None:
+            custom_fields = [f for f in self.jira.fields() if f.get('custom')]
+            self._metadata_cache.set('custom_fields', custom_fields)
+        return custom_fields
+
+    def invalidate_metadata(self):
+        """Drops the cached metadata so the next call refetches it."""
+        self._metadata_cache.clear()
+
+    def iter_issues(self, jql, fields=None, page_size=100):
+        """
+        Yields the issues matching a JQL query, paging through the
+        results lazily so arbitrarily large result sets stream in
+        bounded memory and consumers can stop early.
+
+        Args:
+            jql (str): The JQL query string.
+            fields (str): Comma-separated field list (DEFAULT_FIELDS if None).
+            page_size (int): Issues fetched per request.
+
+        Yields:
+            jira.Issue: The matching issues, in server order.
+        """
+        if fields is None:
+            fields = ','.join(self.DEFAULT_FIELDS)
+        start_at = 0
+        while True:
+            page = self.jira.search_issues(jql, startAt=start_at,
+                                           maxResults=page_size,
+                                           fields=fields)
+            yield from page
+            start_at += len(page)
+            if len(page) < page_size or start_at >= page.total:
+                break
+
+    def search_issues(self, jql, max_results=None, fields=None,
+                      page_size=100):
+        """
+        Runs a JQL search and returns the matching issues.
+
+        Args:
+            jql (str): The JQL query string.
+            max_results (int): Maximum number of issues to return
+                               (None for all; pagination is automatic).
+            fields (str): Comma-separated field list to retrieve.
+                          Defaults to DEFAULT_FIELDS; pass '*all' to
+                          retrieve every field.
+            page_size (int): Issues fetched per request; larger pages
+                             mean fewer round-trips on big result sets.
+
+        Returns:
+            list: The matching issues (empty on error).
+        """
+        try:
+            issues = self.iter_issues(jql, fields=fields,
+                                      page_size=page_size)
+            if max_results is not None:
+                return list(itertools.islice(issues, max_results))
+            return list(issues)
+        except Exception as e:
+            logger.error("Error searching issues with JQL '%s': %s", jql, e)
+            return []
+
+    def search_issues_raw(self, jql, fields=None, page_size=100):
+        """
+        Runs a JQL search against the enhanced search endpoint and
+        returns the raw issue dicts. This skips jira-python's Resource
+        construction and the PropertyHolder __getattr__ walk per field
+        access, which dominates when a report touches several fields on
+        thousands of issues.
+
+        Args:
+            jql (str): The JQL query string.
+            fields (str): Comma-separated field list (DEFAULT_FIELDS if None).
+            page_size (int): Issues fetched per request.
+
+        Returns:
+            list: Raw issue dicts (empty on error).
+        """
+        if fields is None:
+            fields = ','.join(self.DEFAULT_FIELDS)
+        params = {'jql': jql, 'maxResults': page_size, 'fields': fields}
+        issues = []
+        try:
+            while True:
+                response = self.jira._session.get(
+                    f"{self.server}/rest/api/3/search/jql", params=params)
+                response.raise_for_status()
+                data = response.json()
+                issues.extend(data.get('issues', []))
+                token = data.get('nextPageToken')
+                if not token:
+                    return issues
+                params['nextPageToken'] = token
+        except Exception as e:
+            logger.error("Error searching issues (raw) with JQL '%s': %s", jql, e)
+            return []
+
+    @staticmethod
+    def _snapshot_key(jql, fields):
+        """Returns the disk-cache key for a (jql, fields) search."""
+        return hashlib.blake2b(f"{jql}|{fields}".encode()).hexdigest()
+
+    def search_issues_cached(self, jql, fields=None, ttl=900):
+        """
+        Runs a JQL search backed by the persistent on-disk cache.
+
+        On a cache hit, only issues updated since roughly the last fetch
+        are refetched (an `updated >= -Nm` delta query) and merged into
+        the cached snapshot, so repeat runs of the same report pay for
+        the changed issues instead of a full re-scan. Because the cached
+        rows are plain field dicts rather than live jira.Issue objects,
+        the result is a list of {'key': ..., 'fields': {...}} dicts;
+        deleted issues (and issues that stopped matching the JQL)
+        linger until the snapshot's TTL expires. The snapshot records
+        when it was built from a full search, and once that build is
+        older than ttl a full refetch is forced — delta merges refresh
+        the rows but never extend the snapshot's life, so stale entries
+        are bounded even under steady use.
+
+        Falls back to an uncached full search (projected to the same
+        dict shape) when no cache is configured.
+
+        Args:
+            jql (str): The JQL query string.
+            fields (str): Comma-separated field list (DEFAULT_FIELDS if None).
+            ttl (int): Snapshot lifetime in seconds; also bounds the
+                       delta window.
+
+        Returns:
+            list: {'key', 'fields'} dicts for the matching issues.
+        """
+        if fields is None:
+            fields = ','.join(self.DEFAULT_FIELDS)
+        if self._disk_cache is None:
+            return [{'key': issue.key, 'fields': issue.raw['fields']}
+                    for issue in self.search_issues(jql, fields=fields)]
+        key = self._snapshot_key(jql, fields)
+        now = time.time()
+        snapshot = self._disk_cache.get(key)
+        if snapshot is not None and now - snapshot['built'] > ttl:
+            # The full search backing this snapshot is older than the
+            # TTL; deltas can only add/overwrite rows, so force a full
+            # refetch to flush deleted and no-longer-matching issues.
+            snapshot = None
+        if snapshot is None:
+            issues = {issue.key: issue.raw['fields']
+                      for issue in self.search_issues(jql, fields=fields)}
+            snapshot = {'built': now, 'issues': issues}
+        else:
+            minutes = max(1, ttl // 60)
+            delta = self.search_issues(
+                f'({jql}) AND updated >= "-{minutes}m"', fields=fields)
+            issues = dict(snapshot['issues'])
+            for issue in delta:
+                issues[issue.key] = issue.raw['fields']
+            # Keep the original build time: merges refresh rows but
+            # must not push back the next full refetch.
+            snapshot = {'built': snapshot['built'], 'issues': issues}
+            logger.info("Merged %d updated issues into cached snapshot "
+                        "for JQL '%s'", len(delta), jql)
+        self._disk_cache.set(key, snapshot, expire=ttl)
+        return [{'key': issue_key, 'fields': issue_fields}
+                for issue_key, issue_fields in snapshot['issues'].items()]
+
+    def invalidate(self, jql=None, fields=None):
+        """
+        Drops cached search snapshots: the one for (jql, fields), or
+        every snapshot when jql is None.
+        """
+        if self._disk_cache is None:
+            return
+        if jql is None:
+            self._disk_cache.clear()
+            return
+        if fields is None:
+            fields = ','.join(self.DEFAULT_FIELDS)
+        self._disk_cache.delete(self._snapshot_key(jql, fields))
+
+    def count_issues(self, jql):
+        """
+        Returns the number of issues matching a JQL query without
+        fetching the result set: a single one-issue page whose .total
+        comes from Jira's index. (maxResults=0 is not an option —
+        jira-python treats a falsy maxResults as "fetch everything".)
+
+        Returns:
+            int or None: The match total, or None when the count could
+            not be determined, so callers can tell "empty" from
+            "errored" apart.
+        """
+        try:
+            return self.jira.search_issues(jql, maxResults=1,
+                                           fields='id').total
+        except Exception as e:
+            logger.error("Error counting issues with JQL '%s': %s", jql, e)
+            return None
+
+    def get_issues_by_status(self, project_key):
+        """Returns all issues in a project grouped by status name."""
+        issues = self.search_issues(f'project = "{project_key}"')
+        status_map = defaultdict(list)
+        for issue in issues:
+            status_map[str(issue.fields.status)].append(issue)
+        return dict(status_map)
+
+    def get_issues_by_statuses(self, project_key, statuses, fields=None,
+                               page_size=100):
+        """
+        Returns a project's issues in the given statuses, grouped by
+        status name. The status filter runs server-side on Jira's
+        indexed status field, so only the matching subset of rows comes
+        back instead of the whole project.
+        """
+        quoted = ', '.join(f'"{status}"' for status in statuses)
+        issues = self.search_issues(
+            f'project = "{project_key}" AND status in ({quoted})',
+            fields=fields, page_size=page_size)
+        status_map = {status: [] for status in statuses}
+        for issue in issues:
+            status_map.setdefault(str(issue.fields.status), []).append(issue)
+        return status_map
+
+    def get_blocked_issues(self, project_key, fields=None):
+        """Returns the issues currently in Blocked status."""
+        return self.search_issues(
+            f'project = "{project_key}" AND status = "Blocked"',
+            fields=fields or 'summary,status,assignee,created,priority')
+
+    def get_in_progress_issues(self, project_key, fields=None):
+        """Returns the issues currently in In Progress status."""
+        return self.search_issues(
+            f'project = "{project_key}" AND status = "In Progress"',
+            fields=fields or 'summary,status,assignee,duedate')
+
+    def get_in_progress_behind_schedule(self, project_key, fields=None):
+        """
+        Returns the in-progress issues already past their due date. The
+        date comparison runs server-side against Jira's indexed duedate
+        field, so no per-issue date parsing happens client-side.
+        """
+        return self.search_issues(
+            f'project = "{project_key}" AND status = "In Progress" '
+            f'AND duedate < now()',
+            fields=fields or 'summary,status,assignee,duedate')
+
+    def get_in_progress_without_duedate(self, project_key, fields=None):
+        """Returns the in-progress issues that have no due date set."""
+        return self.search_issues(
+            f'project = "{project_key}" AND status = "In Progress" '
+            f'AND duedate is EMPTY',
+            fields=fields or 'summary,status,assignee,duedate')
+
+    def get_old_backlog_issues(self, project_key, days=50, fields=None):
+        """Returns Backlog issues created more than `days` days ago."""
+        return self.search_issues(
+            f'project = "{project_key}" AND status = "Backlog" '
+            f'AND created <= "-{days}d"',
+            fields=fields or 'summary,status,assignee,created')
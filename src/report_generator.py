@@ -0,0 +1,764 @@
+# --- Report Generation ---
+import concurrent.futures
+import functools
+import html
+import logging
+from collections import Counter
+from datetime import date, datetime
+
+# jinja2 renders the digest templates from bytecode compiled once at
+# import; without it the formatters fall back to manual string building.
+try:
+    import jinja2
+except ImportError:
+    jinja2 = None
+
+logger = logging.getLogger(__name__)
+
+# The JQL shapes are fixed; build them once at import and substitute
+# the project key per call instead of re-assembling the query strings
+# in every generator invocation.
+_JQL_PROJECT = 'project = "{project}"'
+_JQL_DIGEST_BUCKETS = ('project = "{project}" AND '
+                       'status in ("Blocked", "In Progress", "Backlog")')
+
+# Both templates render from the precomputed digest view (see
+# build_digest_view), not the raw digest, so the jinja path shares the
+# truncated/formatted lines with the Slack notifier and the manual
+# fallbacks instead of redoing that string work per channel.
+_TEXT_TEMPLATE_SRC = """\
+Daily Jira Status Report
+========================
+Date: {{ view.date }}
+
+{% for project in view.projects %}
+Project: {{ project.project }}
+----------------------------------------
+Total issues: {{ project.total_issues }}
+{% for line in project.status_lines %}
+  {{ line }}
+{% endfor %}
+
+Blocked issues: {{ project.blocked_count }}
+{% for line in project.blocked_lines %}
+  - {{ line }}
+{% endfor %}
+
+In progress: {{ project.in_progress_count }} ({{ project.behind_count }} behind schedule)
+{% for line in project.behind_lines %}
+  - {{ line }}
+{% endfor %}
+
+Backlog older than {{ project.threshold_days }} days: {{ project.backlog_count }}
+{% for line in project.backlog_lines %}
+  - {{ line }}
+{% endfor %}
+
+{% endfor %}"""
+
+_HTML_TEMPLATE_SRC = """\
+<html><head><style>
+body { font-family: Arial, sans-serif; margin: 20px; }
+h1 { color: #0052cc; }
+h2 { color: #172b4d; border-bottom: 2px solid #dfe1e6; padding-bottom: 4px; }
+table { border-collapse: collapse; margin: 10px 0; }
+th, td { border: 1px solid #dfe1e6; padding: 6px 10px; text-align: left; }
+th { background-color: #f4f5f7; }
+.blocked { color: #de350b; }
+.behind { color: #ff8b00; }
+</style></head><body>
+<h1>Daily Jira Status Report &mdash; {{ view.date }}</h1>
+{% for project in view.projects %}
+<h2>Project: {{ project.project }}</h2>
+<p>Total issues: {{ project.total_issues }}</p>
+<table><tr><th>Status</th><th>Count</th><th>%</th></tr>
+{% for status, count, pct in project.status_rows %}
+<tr><td>{{ status }}</td><td>{{ count }}</td><td>{{ pct }}%</td></tr>
+{% endfor %}
+</table>
+<p class='blocked'>Blocked issues: {{ project.blocked_count }}</p>
+{% if project.blocked_lines %}
+<ul>
+{% for line in project.blocked_lines %}
+<li>{{ line }}</li>
+{% endfor %}
+</ul>
+{% endif %}
+<p>In progress: {{ project.in_progress_count }} <span class='behind'>({{ project.behind_count }} behind schedule)</span></p>
+{% if project.behind_lines %}
+<ul>
+{% for line in project.behind_lines %}
+<li>{{ line }}</li>
+{% endfor %}
+</ul>
+{% endif %}
+<p>Backlog older than {{ project.threshold_days }} days: {{ project.backlog_count }}</p>
+{% endfor %}
+</body></html>"""
+
+# Constant frame for the manual HTML fallback, built once at import
+# instead of re-concatenated on every render.
+_HTML_HEAD = (
+    "<html><head><style>"
+    "body { font-family: Arial, sans-serif; margin: 20px; }"
+    "h1 { color: #0052cc; }"
+    "h2 { color: #172b4d; border-bottom: 2px solid #dfe1e6; padding-bottom: 4px; }"
+    "table { border-collapse: collapse; margin: 10px 0; }"
+    "th, td { border: 1px solid #dfe1e6; padding: 6px 10px; text-align: left; }"
+    "th { background-color: #f4f5f7; }"
+    ".blocked { color: #de350b; }"
+    ".behind { color: #ff8b00; }"
+    "</style></head><body>"
+)
+_HTML_TAIL = "</body></html>"
+
+_TEMPLATE_SRCS = {
+    'text': _TEXT_TEMPLATE_SRC,
+    'html': _HTML_TEMPLATE_SRC,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_template(name):
+    """
+    Compiles and memoizes the named digest template. Compilation
+    happens once per process, on the first render that needs the
+    template, and every later call is a dict hit. Returns None when
+    jinja2 is unavailable (the formatters then fall back to manual
+    string building).
+    """
+    if jinja2 is None:
+        return None
+    if name == 'html':
+        # Autoescape closes the door on issue summaries injecting
+        # markup into the emailed HTML.
+        env = jinja2.Environment(autoescape=True, trim_blocks=True,
+                                 lstrip_blocks=True)
+    else:
+        env = jinja2.Environment(trim_blocks=True, lstrip_blocks=True)
+    return env.from_string(_TEMPLATE_SRCS[name])
+
+
+def _flatten_raw_issue(raw):
+    """
+    Projects a raw REST issue dict to the flat shape the report
+    builders read, resolving the nested name objects once.
+    """
+    fields = raw.get('fields') or {}
+    status = fields.get('status')
+    assignee = fields.get('assignee')
+    priority = fields.get('priority')
+    return {
+        'key': raw.get('key'),
+        'summary': fields.get('summary') or '',
+        'status': status.get('name') if status else 'Unknown',
+        'assignee': assignee.get('displayName') if assignee else 'Unassigned',
+        'created': (fields.get('created') or '')[:10],
+        'duedate': fields.get('duedate'),
+        'priority': priority.get('name') if priority else 'None',
+    }
+
+
+class ReportGenerator:
+    """
+    Builds the daily status reports from Jira data.
+
+    Each generate_* method returns a plain dict so the output can be
+    rendered as text, HTML, or Slack blocks by the formatters below.
+    """
+
+    # The digest reports only read these fields; asking Jira for just
+    # them keeps the response payload small.
+    DIGEST_FIELDS = 'summary,status,assignee,created,duedate,priority'
+
+    def __init__(self, jira_client, batch_size=100):
+        self.jira_client = jira_client
+        # Page size for every search this generator issues. Large
+        # projects benefit from bigger pages (fewer HTTP round-trips
+        # per result set); Jira caps the effective value server-side.
+        self.batch_size = batch_size
+
+    def _fetch_project_bundle(self, project_key, days=50, fields=None):
+        """
+        Fetches a project's issues in one JQL round-trip and partitions
+        them into the buckets the digest reports need.
+
+        Returns:
+            dict: issues, per-status counts, and the blocked /
+                  in-progress / old-backlog buckets.
+        """
+        # The bucket rows are filtered server-side: only Blocked /
+        # In Progress / Backlog issues come back with full fields. The
+        # status totals are computed from a status-only projection of
+        # the whole project, which is a fraction of the payload of
+        # fetching every field for every issue.
+        buckets = self.jira_client.get_issues_by_statuses(
+            project_key, ['Blocked', 'In Progress', 'Backlog'],
+            fields=fields or self.DIGEST_FIELDS, page_size=self.batch_size)
+        status_issues = self.jira_client.search_issues(
+            _JQL_PROJECT.format(project=project_key), fields='status',
+            page_size=self.batch_size)
+        # One clock read and one timestamp string per bundle; the
+        # generate_* methods reuse both instead of re-asking per report.
+        now = datetime.now()
+        today = now.date()
+        bundle = {
+            'project': project_key,
+            'threshold_days': days,
+            'issues': status_issues,
+            'status_counts': Counter(str(issue.fields.status)
+                                     for issue in status_issues),
+            'blocked': buckets['Blocked'],
+            'in_progress': buckets['In Progress'],
+            'old_backlog': [],
+            'today': today,
+            'generated_at': now.isoformat(),
+        }
+        for issue in buckets['Backlog']:
+            # fromisoformat is the fast C parser; created is
+            # 'YYYY-MM-DD...' so the first ten chars are the date.
+            created = date.fromisoformat(str(issue.fields.created)[:10])
+            if (today - created).days > days:
+                bundle['old_backlog'].append(issue)
+        return bundle
+
+    def generate_status_summary(self, project_key, bundle=None, fields=None):
+        """Returns issue counts and percentages per status for a project."""
+        if bundle is None:
+            bundle = self._fetch_project_bundle(project_key, fields=fields)
+        total = len(bundle['issues'])
+        summary = {
+            'project': project_key,
+            'total_issues': total,
+            'statuses': {},
+            'generated_at': bundle['generated_at'],
+        }
+        # Hoist the division out of the loop: one reciprocal, then a
+        # multiply per status.
+        pct_scale = 100.0 / total if total else 0.0
+        for status, count in bundle['status_counts'].items():
+            summary['statuses'][status] = {
+                'count': count,
+                'percentage': round(count * pct_scale, 1),
+            }
+        return summary
+
+    def generate_blocked_issues_report(self, project_key, bundle=None,
+                                       fields=None):
+        """Returns the blocked issues for a project with key details."""
+        if bundle is None:
+            issues = self.jira_client.get_blocked_issues(project_key,
+                                                         fields=fields)
+        else:
+            issues = bundle['blocked']
+        report = {
+            'project': project_key,
+            'count': len(issues),
+            'issues': [],
+            'generated_at': bundle['generated_at'] if bundle else datetime.now().isoformat(),
+        }
+        for issue in issues:
+            report['issues'].append({
+                'key': issue.key,
+                'summary': issue.fields.summary,
+                'assignee': str(issue.fields.assignee) if issue.fields.assignee else 'Unassigned',
+                'created': str(issue.fields.created)[:10],
+                'priority': str(issue.fields.priority) if hasattr(issue.fields, 'priority') and issue.fields.priority else 'None',
+            })
+        return report
+
+    def generate_in_progress_report(self, project_key, bundle=None,
+                                    fields=None):
+        """Returns in-progress issues, flagging the ones behind schedule."""
+        behind_keys = None
+        if bundle is None:
+            # Standalone path: let Jira evaluate `duedate < now()` on its
+            # indexed duedate field instead of parsing dates per issue
+            # here, and run the two searches concurrently over the
+            # pooled connections.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                all_future = executor.submit(
+                    self.jira_client.get_in_progress_issues, project_key,
+                    fields=fields)
+                behind_future = executor.submit(
+                    self.jira_client.get_in_progress_behind_schedule,
+                    project_key, fields=fields)
+                issues = all_future.result()
+                behind_keys = {issue.key for issue in behind_future.result()}
+        else:
+            issues = bundle['in_progress']
+        today = bundle['today'] if bundle else datetime.now().date()
+        report = {
+            'project': project_key,
+            'count': len(issues),
+            'issues': [],
+            'behind_schedule': [],
+            'generated_at': bundle['generated_at'] if bundle else datetime.now().isoformat(),
+        }
+        for issue in issues:
+            entry = {
+                'key': issue.key,
+                'summary': issue.fields.summary,
+                'assignee': str(issue.fields.assignee) if issue.fields.assignee else 'Unassigned',
+                'duedate': issue.fields.duedate if hasattr(issue.fields, 'duedate') else None,
+            }
+            report['issues'].append(entry)
+            if behind_keys is not None:
+                behind = entry['key'] in behind_keys
+            else:
+                # Bundle path: the issues are already local, so the date
+                # test stays client-side on the fast C parser.
+                behind = (entry['duedate']
+                          and date.fromisoformat(entry['duedate']) < today)
+            if behind:
+                report['behind_schedule'].append(entry)
+        return report
+
+    def generate_old_backlog_report(self, project_key, days=50, bundle=None,
+                                    fields=None):
+        """Returns Backlog issues older than `days` days."""
+        if bundle is None:
+            issues = self.jira_client.get_old_backlog_issues(project_key, days,
+                                                             fields=fields)
+        else:
+            issues = bundle['old_backlog']
+        today = bundle['today'] if bundle else datetime.now().date()
+        report = {
+            'project': project_key,
+            'threshold_days': days,
+            'count': len(issues),
+            'issues': [],
+            'generated_at': bundle['generated_at'] if bundle else datetime.now().isoformat(),
+        }
+        for issue in issues:
+            created = date.fromisoformat(str(issue.fields.created)[:10])
+            age_days = (today - created).days
+            report['issues'].append({
+                'key': issue.key,
+                'summary': issue.fields.summary,
+                'assignee': str(issue.fields.assignee) if issue.fields.assignee else 'Unassigned',
+                'age_days': age_days,
+            })
+        return report
+
+    def generate_assignee_distribution(self, project_key, fields='assignee'):
+        """Returns the issue count per assignee for a project."""
+        # Only the assignee is read, so by default only the assignee
+        # comes over the wire.
+        issues = self.jira_client.search_issues(
+            _JQL_PROJECT.format(project=project_key), fields=fields,
+            page_size=self.batch_size)
+        assignees = [
+            str(issue.fields.assignee) if issue.fields.assignee else 'Unassigned'
+            for issue in issues
+        ]
+        # Large projects count in C via numpy; below the threshold the
+        # Counter path wins because it skips the numpy import and the
+        # array construction overhead. Like the other optional
+        # accelerators, a missing numpy just means the Counter path.
+        np = None
+        if len(issues) > 5000:
+            try:
+                import numpy as np
+            except ImportError:
+                pass
+        if np is not None:
+            values, counts = np.unique(np.array(assignees), return_counts=True)
+            order = np.argsort(-counts)
+            pct_scale = 100.0 / len(issues)
+            pct = counts * pct_scale
+            distribution = [
+                {
+                    'assignee': str(values[i]),
+                    'count': int(counts[i]),
+                    'percentage': round(float(pct[i]), 1),
+                }
+                for i in order
+            ]
+        else:
+            counts = Counter(assignees)
+            distribution = [
+                {
+                    'assignee': assignee,
+                    'count': count,
+                    'percentage': round(count * 100.0 / len(issues), 1) if issues else 0.0,
+                }
+                for assignee, count in counts.most_common()
+            ]
+        return {
+            'project': project_key,
+            'total_issues': len(issues),
+            'distribution': distribution,
+            'generated_at': datetime.now().isoformat(),
+        }
+
+    def generate_project_reports(self, project_key, days=50):
+        """
+        Builds the status summary, blocked, in-progress, and old-backlog
+        reports for one project from a single fetch: one bundle feeds
+        all four, instead of each report issuing its own JQL.
+
+        Returns:
+            dict: status_summary, blocked, in_progress, and old_backlog
+                  report dicts.
+        """
+        bundle = self._fetch_project_bundle(project_key, days=days)
+        return {
+            'status_summary': self.generate_status_summary(project_key,
+                                                           bundle=bundle),
+            'blocked': self.generate_blocked_issues_report(project_key,
+                                                           bundle=bundle),
+            'in_progress': self.generate_in_progress_report(project_key,
+                                                            bundle=bundle),
+            'old_backlog': self.generate_old_backlog_report(project_key,
+                                                            days=days,
+                                                            bundle=bundle),
+        }
+
+    def generate_daily_digest(self, project_keys=None, parallel=True):
+        """
+        Builds the combined daily digest across the given projects.
+
+        Args:
+            project_keys (list): Project keys to include. Defaults to the
+                                 first five projects on the instance.
+            parallel (bool): Build the project sections on a thread
+                             pool (the default) or sequentially.
+
+        Returns:
+            dict: The digest with per-project report sections, in
+                  project_keys order.
+        """
+        if project_keys is None:
+            # get_projects is served from the metadata TTL cache, so
+            # repeat digests don't re-hit the projects endpoint.
+            project_keys = [p.key for p in self.jira_client.get_projects()[:5]]
+
+        digest = {
+            'date': datetime.now().strftime('%Y-%m-%d'),
+            'projects': [],
+        }
+        # An explicitly empty project list means there is nothing to do;
+        # don't touch the network at all.
+        if not project_keys:
+            return digest
+        # Each project's section is a bundle of network-bound Jira
+        # searches, so build the sections concurrently; the client
+        # releases the GIL during I/O. The pool is kept small to stay
+        # under Jira's rate limits. executor.map preserves the caller's
+        # project order, so the digest is deterministic either way.
+        if parallel:
+            max_workers = min(8, len(project_keys))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Weed out empty/archived projects first: one index-only
+                # count query each, instead of four full report fetches
+                # that would all come back with zero rows. A failed
+                # count (None) keeps the project — only a confirmed
+                # zero drops it.
+                counts = executor.map(
+                    lambda key: self.jira_client.count_issues(
+                        _JQL_PROJECT.format(project=key)),
+                    project_keys)
+                active_keys = [key for key, count in zip(project_keys, counts)
+                               if count != 0]
+                sections = list(executor.map(self._safe_project_report,
+                                             active_keys))
+        else:
+            active_keys = [
+                key for key in project_keys
+                if self.jira_client.count_issues(
+                    _JQL_PROJECT.format(project=key)) != 0
+            ]
+            sections = [self._safe_project_report(key) for key in active_keys]
+        digest['projects'] = [section for section in sections
+                              if section is not None]
+        return digest
+
+    def _safe_project_report(self, project_key):
+        """Builds one project section, logging instead of raising."""
+        try:
+            return self._build_project_report(project_key)
+        except Exception as e:
+            logger.error("Error generating digest for project '%s': %s",
+                         project_key, e)
+            return None
+
+    async def generate_daily_digest_async(self, async_client, project_keys=None):
+        """
+        Async counterpart of generate_daily_digest, built on an
+        AsyncJiraClient: every project's searches run as tasks on one
+        event loop, multiplexed over the client's HTTP/2 connection,
+        instead of occupying a thread each.
+
+        Args:
+            async_client (AsyncJiraClient): An already-connected client.
+            project_keys (list): Project keys to include. Defaults to
+                                 the first five projects on the instance.
+
+        Returns:
+            dict: The digest, same shape as generate_daily_digest.
+        """
+        import asyncio
+
+        if project_keys is None:
+            projects = await async_client.get_projects()
+            project_keys = [project['key'] for project in projects[:5]]
+
+        async def build_section(project_key):
+            bucket_rows, status_rows = await asyncio.gather(
+                async_client.search_issues(
+                    _JQL_DIGEST_BUCKETS.format(project=project_key),
+                    fields=self.DIGEST_FIELDS),
+                async_client.search_issues(
+                    _JQL_PROJECT.format(project=project_key),
+                    fields='status'))
+            return self._build_project_report_from_raw(
+                project_key, bucket_rows, status_rows)
+
+        digest = {
+            'date': datetime.now().strftime('%Y-%m-%d'),
+            'projects': [],
+        }
+        results = await asyncio.gather(
+            *(build_section(project_key) for project_key in project_keys),
+            return_exceptions=True)
+        for project_key, result in zip(project_keys, results):
+            if isinstance(result, Exception):
+                logger.error("Error generating digest for project '%s': %s",
+                             project_key, result)
+            else:
+                digest['projects'].append(result)
+        return digest
+
+    def _build_project_report_from_raw(self, project_key, bucket_rows,
+                                       status_rows, days=50):
+        """
+        Builds one digest section from raw REST issue dicts, bucketing
+        by status in a single pass. Mirrors the section shape produced
+        by _build_project_report.
+        """
+        now = datetime.now()
+        today = now.date()
+        generated_at = now.isoformat()
+
+        status_counts = Counter(
+            row['status'] for row in map(_flatten_raw_issue, status_rows))
+        total = len(status_rows)
+        pct_scale = 100.0 / total if total else 0.0
+        status_summary = {
+            'project': project_key,
+            'total_issues': total,
+            'statuses': {
+                status: {'count': count,
+                         'percentage': round(count * pct_scale, 1)}
+                for status, count in status_counts.items()
+            },
+            'generated_at': generated_at,
+        }
+
+        blocked, in_progress, behind, old_backlog = [], [], [], []
+        for row in map(_flatten_raw_issue, bucket_rows):
+            if row['status'] == 'Blocked':
+                blocked.append({
+                    'key': row['key'],
+                    'summary': row['summary'],
+                    'assignee': row['assignee'],
+                    'created': row['created'],
+                    'priority': row['priority'],
+                })
+            elif row['status'] == 'In Progress':
+                entry = {
+                    'key': row['key'],
+                    'summary': row['summary'],
+                    'assignee': row['assignee'],
+                    'duedate': row['duedate'],
+                }
+                in_progress.append(entry)
+                if entry['duedate'] and date.fromisoformat(entry['duedate']) < today:
+                    behind.append(entry)
+            elif row['status'] == 'Backlog' and row['created']:
+                age_days = (today - date.fromisoformat(row['created'])).days
+                if age_days > days:
+                    old_backlog.append({
+                        'key': row['key'],
+                        'summary': row['summary'],
+                        'assignee': row['assignee'],
+                        'age_days': age_days,
+                    })
+
+        return {
+            'project': project_key,
+            'status_summary': status_summary,
+            'blocked': {
+                'project': project_key,
+                'count': len(blocked),
+                'issues': blocked,
+                'generated_at': generated_at,
+            },
+            'in_progress': {
+                'project': project_key,
+                'count': len(in_progress),
+                'issues': in_progress,
+                'behind_schedule': behind,
+                'generated_at': generated_at,
+            },
+            'old_backlog': {
+                'project': project_key,
+                'threshold_days': days,
+                'count': len(old_backlog),
+                'issues': old_backlog,
+                'generated_at': generated_at,
+            },
+        }
+
+    def _build_project_report(self, project_key):
+        """Builds the full digest section for one project."""
+        logger.info("Generating digest section for project '%s'...", project_key)
+        # The digest consumes raw issue dicts: every field it reads is
+        # one dict lookup instead of a trip through jira-python's
+        # PropertyHolder __getattr__, and no Resource objects are built
+        # at all. The standalone generate_* methods keep the Issue-based
+        # bundle path for external callers.
+        bucket_rows = self.jira_client.search_issues_raw(
+            _JQL_DIGEST_BUCKETS.format(project=project_key),
+            fields=self.DIGEST_FIELDS, page_size=self.batch_size)
+        status_rows = self.jira_client.search_issues_raw(
+            _JQL_PROJECT.format(project=project_key), fields='status',
+            page_size=self.batch_size)
+        return self._build_project_report_from_raw(project_key, bucket_rows,
+                                                   status_rows)
+
+    def build_digest_view(self, digest):
+        """
+        Builds a normalized render view of a digest: per-project lists
+        of already-truncated, already-formatted lines that the text,
+        HTML, and Slack formatters all consume. The view is cached on
+        the digest itself, so rendering the same digest for several
+        channels only pays for the string work once.
+
+        Returns:
+            dict: date plus per-project status/blocked/behind/backlog
+                  line lists, index-aligned with digest['projects'].
+        """
+        view = digest.get('_view')
+        if view is not None:
+            return view
+        projects = []
+        for project in digest['projects']:
+            summary = project['status_summary']
+            blocked = project['blocked']
+            in_progress = project['in_progress']
+            backlog = project['old_backlog']
+            status_rows = [(status, info['count'], info['percentage'])
+                           for status, info in summary['statuses'].items()]
+            projects.append({
+                'project': project['project'],
+                'total_issues': summary['total_issues'],
+                'status_rows': status_rows,
+                'status_lines': [f"{status}: {count} ({pct}%)"
+                                 for status, count, pct in status_rows],
+                'blocked_count': blocked['count'],
+                'blocked_lines': [
+                    f"{issue['key']}: {issue['summary'][:60]} ({issue['assignee']})"
+                    for issue in blocked['issues']
+                ],
+                'in_progress_count': in_progress['count'],
+                'behind_count': len(in_progress['behind_schedule']),
+                'behind_lines': [
+                    f"{issue['key']}: {issue['summary'][:60]} "
+                    f"(due {issue['duedate']}, {issue['assignee']})"
+                    for issue in in_progress['behind_schedule']
+                ],
+                'threshold_days': backlog['threshold_days'],
+                'backlog_count': backlog['count'],
+                'backlog_lines': [
+                    f"{issue['key']}: {issue['summary'][:60]} "
+                    f"({issue['age_days']} days old)"
+                    for issue in backlog['issues'][:10]
+                ],
+            })
+        view = {'date': digest['date'], 'projects': projects}
+        digest['_view'] = view
+        return view
+
+    def format_digest_as_text(self, digest):
+        """Renders the digest as a plain-text report."""
+        view = self.build_digest_view(digest)
+        template = _get_template('text')
+        if template is not None:
+            return template.render(view=view)
+        # Fallback without jinja2: join the precomputed view lines.
+        lines = [
+            "Daily Jira Status Report",
+            "========================",
+            f"Date: {view['date']}",
+            "",
+        ]
+        for project in view['projects']:
+            lines.append(f"Project: {project['project']}")
+            lines.append("-" * 40)
+
+            lines.append(f"Total issues: {project['total_issues']}")
+            for line in project['status_lines']:
+                lines.append(f"  {line}")
+
+            lines.append(f"\nBlocked issues: {project['blocked_count']}")
+            for line in project['blocked_lines']:
+                lines.append(f"  - {line}")
+
+            lines.append(f"\nIn progress: {project['in_progress_count']} "
+                         f"({project['behind_count']} behind schedule)")
+            for line in project['behind_lines']:
+                lines.append(f"  - {line}")
+
+            lines.append(f"\nBacklog older than {project['threshold_days']} days: "
+                         f"{project['backlog_count']}")
+            for line in project['backlog_lines']:
+                lines.append(f"  - {line}")
+            lines.append("")
+        return "\n".join(lines)
+
+    def format_digest_as_html(self, digest):
+        """Renders the digest as an HTML report for email."""
+        view = self.build_digest_view(digest)
+        template = _get_template('html')
+        if template is not None:
+            return template.render(view=view)
+        # Fallback without jinja2: collect the markup pieces in a list
+        # and join once at the end — no quadratic intermediate copies
+        # from repeated string concatenation. The view lines are raw
+        # text shared with the text/Slack outputs, so everything
+        # interpolated here gets escaped, matching the template path's
+        # autoescape.
+        esc = html.escape
+        parts = [_HTML_HEAD,
+                 f"<h1>Daily Jira Status Report &mdash; {esc(str(view['date']))}</h1>"]
+        for project in view['projects']:
+            parts.append(f"<h2>Project: {esc(str(project['project']))}</h2>")
+
+            parts.append(f"<p>Total issues: {project['total_issues']}</p>")
+            parts.append("<table><tr><th>Status</th><th>Count</th><th>%</th></tr>")
+            for status, count, pct in project['status_rows']:
+                parts.append(f"<tr><td>{esc(str(status))}</td>"
+                             f"<td>{count}</td><td>{pct}%</td></tr>")
+            parts.append("</table>")
+
+            parts.append(f"<p class='blocked'>Blocked issues: {project['blocked_count']}</p>")
+            if project['blocked_lines']:
+                parts.append("<ul>")
+                for line in project['blocked_lines']:
+                    parts.append(f"<li>{esc(line)}</li>")
+                parts.append("</ul>")
+
+            parts.append(f"<p>In progress: {project['in_progress_count']} "
+                         f"<span class='behind'>({project['behind_count']} behind schedule)</span></p>")
+            if project['behind_lines']:
+                parts.append("<ul>")
+                for line in project['behind_lines']:
+                    parts.append(f"<li>{esc(line)}</li>")
+                parts.append("</ul>")
+
+            parts.append(f"<p>Backlog older than {project['threshold_days']} days: "
+                         f"{project['backlog_count']}</p>")
+        parts.append(_HTML_TAIL)
+        return "".join(parts)
@@ -0,0 +1,174 @@
+# --- Slack Notifications ---
+import concurrent.futures
+import json
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+# orjson serializes the nested block payloads in C and returns bytes
+# directly; fall back to the stdlib encoder when it isn't installed.
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+logger = logging.getLogger(__name__)
+
+
+class SlackNotifier:
+    """
+    Posts report messages to a Slack incoming webhook.
+
+    A pooled requests.Session is held on the instance, so the TLS
+    handshake to hooks.slack.com is paid once and amortized across all
+    sends; the mounted Retry transparently backs off on Slack's 429
+    rate-limit responses.
+    """
+
+    def __init__(self, webhook_url):
+        self.webhook_url = webhook_url
+        self._session = requests.Session()
+        # allowed_methods=None retries every verb; urllib3's default
+        # excludes POST, which is the only method this class ever uses.
+        # Re-posting a webhook payload is harmless (worst case a
+        # duplicate message), so retrying is safe here.
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.5,
+                              status_forcelist=[429, 500, 502, 503],
+                              allowed_methods=None))
+        self._session.mount('https://', adapter)
+
+    def _send_payload(self, payload):
+        """POSTs a JSON payload to the webhook. Returns True on success."""
+        try:
+            response = self._session.post(
+                self.webhook_url, data=_dumps(payload),
+                headers={'Content-Type': 'application/json'}, timeout=10)
+            return response.status_code == 200
+        except Exception as e:
+            logger.error("Error sending Slack message: %s", e)
+            return False
+
+    def send_message(self, text):
+        """Sends a plain-text Slack message."""
+        return self._send_payload({'text': text})
+
+    def send_blocks(self, blocks, text=''):
+        """Sends a Block Kit message with a plain-text fallback."""
+        return self._send_payload({'text': text, 'blocks': blocks})
+
+    def _iter_project_blocks(self, project, view_project=None):
+        """Yields the Block Kit blocks for one project section."""
+        summary = project['status_summary']
+        blocked = project['blocked']
+        in_progress = project['in_progress']
+        backlog = project['old_backlog']
+        if view_project is not None:
+            status_lines = view_project['status_lines']
+            blocked_lines = view_project['blocked_lines'][:5]
+        else:
+            status_lines = [f"{status}: {info['count']} ({info['percentage']}%)"
+                            for status, info in summary['statuses'].items()]
+            blocked_lines = [
+                f"{issue['key']}: {issue['summary'][:60]} ({issue['assignee']})"
+                for issue in blocked['issues'][:5]
+            ]
+
+        yield {
+            'type': 'section',
+            'text': {'type': 'mrkdwn',
+                     'text': f"*Project: {project['project']}* "
+                             f"({summary['total_issues']} issues)"},
+        }
+        if status_lines:
+            yield {
+                'type': 'section',
+                'text': {'type': 'mrkdwn',
+                         'text': '\n'.join(f"• {line}" for line in status_lines)},
+            }
+        yield {
+            'type': 'section',
+            'text': {'type': 'mrkdwn',
+                     'text': f":no_entry: Blocked: *{blocked['count']}*  "
+                             f":hourglass: In progress: *{in_progress['count']}* "
+                             f"({len(in_progress['behind_schedule'])} behind)  "
+                             f":file_cabinet: Old backlog: *{backlog['count']}*"},
+        }
+        if blocked_lines:
+            yield {
+                'type': 'section',
+                'text': {'type': 'mrkdwn',
+                         'text': '\n'.join(f"• {line}" for line in blocked_lines)},
+            }
+        yield {'type': 'divider'}
+
+    def _iter_blocks(self, digest):
+        """
+        Yields the digest's Block Kit blocks lazily. list() over the
+        generator builds the final list in one allocation instead of
+        growing it through ~10 .append calls per project, and the
+        per-project generator keeps the block layout testable in
+        isolation.
+        """
+        yield {
+            'type': 'header',
+            'text': {'type': 'plain_text',
+                     'text': f"Daily Jira Status Report - {digest['date']}"},
+        }
+        yield {'type': 'divider'}
+        # Reuse the render view cached on the digest by the report
+        # generator, so the truncated summaries and percentage lines
+        # aren't re-formatted a third time after the text and HTML
+        # renders; fall back to inline formatting for bare digests.
+        view_projects = (digest['_view']['projects']
+                         if '_view' in digest else None)
+        for index, project in enumerate(digest['projects']):
+            view_project = (view_projects[index]
+                            if view_projects is not None else None)
+            yield from self._iter_project_blocks(project, view_project)
+
+    def send_report(self, digest):
+        """Sends the daily digest as a formatted Block Kit message."""
+        blocks = list(self._iter_blocks(digest))
+        text = f"Daily Jira Status Report - {digest['date']}"
+        # Slack hard-caps a message at 50 blocks; split long digests
+        # across several messages instead of getting the whole payload
+        # rejected.
+        if len(blocks) > 45:
+            success = True
+            for start in range(0, len(blocks), 45):
+                success = self.send_blocks(blocks[start:start + 45],
+                                           text=text) and success
+            return success
+        return self.send_blocks(blocks, text=text)
+
+    def send_reports_parallel(self, digests, max_workers=4):
+        """
+        Sends several digests concurrently over the pooled session.
+
+        Returns:
+            bool: True if every digest was delivered.
+        """
+        if not digests:
+            return True
+        max_workers = min(max_workers, len(digests))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self.send_report, digests))
+        return all(results)
+
+    def send_simple_report(self, digest):
+        """Sends the digest as a compact plain-text summary."""
+        lines = [f"Daily Jira Status Report - {digest['date']}"]
+        for project in digest['projects']:
+            summary = project['status_summary']
+            blocked = project['blocked']
+            in_progress = project['in_progress']
+            lines.append(f"{project['project']}: {summary['total_issues']} issues, "
+                         f"{blocked['count']} blocked, "
+                         f"{in_progress['count']} in progress "
+                         f"({len(in_progress['behind_schedule'])} behind)")
+        return self.send_message('\n'.join(lines))
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# --- System Smoke Test ---
+# Exercises config loading, the Jira connection, and report generation
+# end to end against the live instance. Run manually before deploying:
+#   python3 test_system.py
+import argparse
+import concurrent.futures
+import logging
+import os
+import time
+from pathlib import Path
+
+# ConfigManager is light; the Jira/report modules (which drag in
+# requests and the jira package) are imported inside the tests that
+# need them, so a config failure exits before paying those imports.
+from src.config_manager import ConfigManager
+
+# Configure basic logging
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+_BANNER = "=" * 80
+
+
+def test_config(config_manager):
+    """
+    Loads and validates the injected manager's config file.
+
+    Returns:
+        ConfigManager: The loaded manager, or None on failure.
+    """
+    logger.info("Testing configuration...")
+    try:
+        config_manager.load_config()
+    except (FileNotFoundError, ValueError) as e:
+        logger.error("Configuration test failed: %s", e)
+        return None
+    logger.info("Configuration loaded and validated")
+    logger.info("  Email configured: %s", config_manager.has_email_config())
+    logger.info("  Slack configured: %s", config_manager.has_slack_config())
+    return config_manager
+
+
+def test_jira_connection(config_manager, use_cache=True):
+    """
+    Connects to Jira and fetches the project list once.
+
+    Returns:
+        tuple: (jira_client, projects), or (None, None) on failure.
+        The projects are returned so later tests reuse this fetch
+        instead of paying a second round-trip.
+    """
+    from src.jira_client import JiraClient
+
+    logger.info("Testing Jira connection...")
+    jira_cfg = config_manager.get_jira_config()
+    jira_client = JiraClient(jira_cfg['server'], jira_cfg['email'],
+                             jira_cfg['api_token'])
+    if not jira_client.connect():
+        logger.error("Jira connection test failed")
+        return None, None
+    # Two projects are plenty for a smoke test; the full list is cached
+    # on the client (and on disk across runs, unless --no-cache), so
+    # this costs one fetch however often it's sliced.
+    projects = jira_client.get_projects(limit=2, use_disk_cache=use_cache)
+    logger.info("Connected; fetched %d projects", len(projects))
+    for project in projects:
+        logger.info("  %s: %s", project.key, project.name)
+    return jira_client, projects
+
+
+def test_report_generation(jira_client, projects, fast=False):
+    """
+    Generates each report type for the first visible project, using
+    the already-fetched project list.
+
+    Args:
+        fast (bool): Skip the HTML render and sample dumps, saving a
+                     full formatting pass when only the data path is
+                     being checked (e.g. CI).
+
+    Returns:
+        bool: True if all reports generated successfully.
+    """
+    from src.report_generator import ReportGenerator
+
+    logger.info("Testing report generation...")
+    if not projects:
+        logger.error("No projects available to report on")
+        return False
+    project_key = projects[0].key
+    # 500-issue pages: big projects come back in a handful of
+    # round-trips instead of dozens of default-sized ones.
+    generator = ReportGenerator(jira_client, batch_size=500)
+
+    # The fused per-project reports (one JQL bundle for all four) and
+    # the digest are independent I/O-bound paths, so run them
+    # concurrently; wall time collapses to the slower of the two.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        futures = {
+            'project_reports': executor.submit(
+                generator.generate_project_reports, project_key),
+            'digest': executor.submit(
+                generator.generate_daily_digest, [project_key],
+                parallel=True),
+        }
+        results = {}
+        failed = False
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                logger.error("Report generation '%s' failed: %s", name, e)
+                failed = True
+    if failed:
+        return False
+
+    reports = results['project_reports']
+    logger.info("Status summary: %d issues in %s",
+                reports['status_summary']['total_issues'], project_key)
+    logger.info("Blocked issues report: %d blocked",
+                reports['blocked']['count'])
+    logger.info("In-progress report: %d in progress (%d behind)",
+                reports['in_progress']['count'],
+                len(reports['in_progress']['behind_schedule']))
+    digest = results['digest']
+
+    text_report = generator.format_digest_as_text(digest)
+    if fast:
+        logger.info("Rendered digest: %d chars text (fast mode, HTML skipped)",
+                    len(text_report))
+        return True
+    html_report = generator.format_digest_as_html(digest)
+    logger.info("Rendered digest: %d chars text, %d chars HTML",
+                len(text_report), len(html_report))
+    # Dump rendered samples for manual inspection, but only when asked:
+    # CI never looks at them, so it shouldn't pay the disk writes.
+    if os.environ.get('SAVE_SAMPLES'):
+        # A nanosecond tick is unique enough for a filename and skips
+        # the datetime construction + strftime formatting.
+        suffix = time.time_ns()
+        Path(f'sample_report_{suffix}.txt').write_text(text_report)
+        Path(f'sample_report_{suffix}.html').write_text(html_report)
+        logger.info("Sample reports written with suffix %d", suffix)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='End-to-end smoke test for the Jira reporting system.')
+    parser.add_argument('--fast', action='store_true',
+                        help='skip the HTML render and sample dumps')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='bypass the on-disk project cache')
+    args = parser.parse_args()
+
+    # One record per banner: a single handler dispatch and flush.
+    logger.info("%s\nJira reporting system smoke test\n%s", _BANNER, _BANNER)
+
+    # One ConfigManager for the whole run: load_config parses the file
+    # once and later calls are no-ops, so every test shares the parsed
+    # config instead of re-reading config.json.
+    config_manager = test_config(ConfigManager())
+    if config_manager is None:
+        return 1
+
+    jira_client, projects = test_jira_connection(config_manager,
+                                                 use_cache=not args.no_cache)
+    if jira_client is None:
+        return 1
+
+    if not test_report_generation(jira_client, projects, fast=args.fast):
+        return 1
+
+    logger.info("%s\nAll smoke tests passed\n%s", _BANNER, _BANNER)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())